@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    A bounded mapping that evicts the least recently used entry when it is full.
+
+    Used by semantic models to reuse per-token results. Values should be immutable,
+    since the same object is returned on every hit.
+    """
+
+    def __init__(self, maxsize: int | None = 10000):
+        """
+        :param maxsize: maximum number of entries, 0 to disable caching, None for no limit
+        :type maxsize: int | None
+        :raises ValueError: if maxsize is negative
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f'maxsize must be non-negative or None, got {maxsize}')
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, key):
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def __setitem__(self, key, value) -> None:
+        if self.maxsize == 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
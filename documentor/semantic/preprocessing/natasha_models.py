@@ -0,0 +1,27 @@
+from functools import cache
+
+from natasha import NewsEmbedding, NewsMorphTagger
+
+
+@cache
+def news_embedding() -> NewsEmbedding:
+    """
+    Get the Natasha news embedding shared by all semantic models.
+
+    The embedding is loaded from disk on the first call only.
+
+    :return: Natasha news embedding
+    :rtype: NewsEmbedding
+    """
+    return NewsEmbedding()
+
+
+@cache
+def news_morph_tagger() -> NewsMorphTagger:
+    """
+    Get the Natasha morphology tagger shared by all semantic models.
+
+    :return: Natasha morphology tagger built on the shared embedding
+    :rtype: NewsMorphTagger
+    """
+    return NewsMorphTagger(news_embedding())
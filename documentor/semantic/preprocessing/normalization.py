@@ -1,10 +1,12 @@
 import re
 
 from .base import BaseSemanticModel
+from .cache import LRUCache
+from .natasha_models import news_embedding, news_morph_tagger
 from documentor.structuries.document import Document
 from documentor.structuries.document import Document
 
-from natasha import (Segmenter, MorphVocab, Doc, NewsEmbedding, NewsMorphTagger)
+from natasha import (Segmenter, MorphVocab, Doc)
 import nltk
 from nltk.stem import WordNetLemmatizer
 from nltk.tokenize import word_tokenize
@@ -14,11 +16,14 @@ from nltk import pos_tag
 
 class NLTKNormalization(BaseSemanticModel):
 
-    def __init__(self):
+    def __init__(self, cache_size: int | None = 10000):
         """
         Initialize the class for lemmatization using NLTK.
+
+        :param cache_size: Number of most recently used lemmas to keep, 0 to disable caching, None for no limit.
         """
         self.lemmatizer = WordNetLemmatizer()
+        self._lemma_cache = LRUCache(cache_size)
 
     def __call__(self, document: Document, *args, **kwargs):
         """
@@ -27,14 +32,29 @@ class NLTKNormalization(BaseSemanticModel):
         :param document: A Document object containing the text.
         :return: Lemmatized text.
         """
-        tokens = word_tokenize(' '.join([fragment.value for fragment in document.build_fragments()]))
+        tokens = word_tokenize(' '.join(document.value))
 
         pos_tags = pos_tag(tokens)
 
-        lemmatized_tokens = [self.lemmatizer.lemmatize(token, self.get_wordnet_pos(pos)) for token, pos in pos_tags]
+        lemmatized_tokens = [self.lemmatize(token, pos) for token, pos in pos_tags]
 
         return ' '.join(lemmatized_tokens)
 
+    def lemmatize(self, token: str, treebank_tag: str) -> str:
+        """
+        Lemmatizes a token, reusing the result for tokens with the same part-of-speech tag seen before.
+
+        :param token: The token to lemmatize.
+        :param treebank_tag: Part-of-speech tag of the token in Penn Treebank format.
+        :return: Lemma of the token.
+        """
+        key = (token, treebank_tag)
+        if key in self._lemma_cache:
+            return self._lemma_cache[key]
+        lemma = self.lemmatizer.lemmatize(token, self.get_wordnet_pos(treebank_tag))
+        self._lemma_cache[key] = lemma
+        return lemma
+
     def get_wordnet_pos(self, treebank_tag):
         """
         Converts a part-of-speech tag from Penn Treebank format to WordNet format.
@@ -62,8 +82,8 @@ class NatashaNormalization(BaseSemanticModel):
         self.doc: Doc | None = None
         self.segmenter = Segmenter()
         self.morph_vocab = MorphVocab()
-        self.emb = NewsEmbedding()
-        self.morph_tagger = NewsMorphTagger(self.emb)
+        self.emb = news_embedding()
+        self.morph_tagger = news_morph_tagger()
         self.word_pattern = re.compile(r'^[a-zA-Zа-яА-ЯёЁ]+$')
 
     def __call__(self, document: Document, *args, **kwargs):
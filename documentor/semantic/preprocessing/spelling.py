@@ -1,11 +1,11 @@
 from .base import BaseSemanticModel
+from .cache import LRUCache
+from .natasha_models import news_embedding, news_morph_tagger
 from documentor.structuries.document import Document
 
 from natasha import (
     Segmenter,
     MorphVocab,
-    NewsEmbedding,
-    NewsMorphTagger,
     NewsNERTagger,
     NewsSyntaxParser
 )
@@ -15,17 +15,20 @@ import pandas as pd
 
 
 class NatashaSpellChecker(BaseSemanticModel):
-    def __init__(self):
+    def __init__(self, cache_size: int | None = 10000):
         """
         Initialize necessary components of Natasha for spell checking.
+
+        :param cache_size: Number of most recently used word parses to keep, 0 to disable caching, None for no limit.
         """
         self.segmenter = Segmenter()
         self.morph_vocab = MorphVocab()
-        self.emb = NewsEmbedding()
-        self.morph_tagger = NewsMorphTagger(self.emb)
+        self.emb = news_embedding()
+        self.morph_tagger = news_morph_tagger()
         self.syntax_parser = NewsSyntaxParser(self.emb)
         self.ner_tagger = NewsNERTagger(self.emb)
         self.pymorphy_analyzer = PymorphyAnalyzer()
+        self._parse_cache = LRUCache(cache_size)
 
     def __call__(self, document: Document, *args, **kwargs) -> Document:
         """
@@ -51,6 +54,19 @@ class NatashaSpellChecker(BaseSemanticModel):
 
         return Document(pd.DataFrame(corrected_text))
 
+    def parse(self, word: str) -> tuple:
+        """
+        Returns pymorphy2 parses of the word, caching them per word.
+
+        :param word: The word to parse.
+        :return: Tuple of possible parses.
+        """
+        if word in self._parse_cache:
+            return self._parse_cache[word]
+        parsed_word = tuple(self.pymorphy_analyzer.parse(word))
+        self._parse_cache[word] = parsed_word
+        return parsed_word
+
     def is_correct(self, word: str) -> bool:
         """
         Checks if the word is spelled correctly.
@@ -58,7 +74,7 @@ class NatashaSpellChecker(BaseSemanticModel):
         :param word: The word to check.
         :return: True if the word is correct, otherwise False.
         """
-        parsed_word = self.pymorphy_analyzer.parse(word)
+        parsed_word = self.parse(word)
         for parse in parsed_word:
             if parse.is_known:
                 return True
@@ -71,7 +87,7 @@ class NatashaSpellChecker(BaseSemanticModel):
         :param word: The word to correct.
         :return: The corrected word.
         """
-        suggestions = self.pymorphy_analyzer.parse(word)
+        suggestions = self.parse(word)
         if suggestions:
             best_suggestion = suggestions[0]
             return best_suggestion.normal_form
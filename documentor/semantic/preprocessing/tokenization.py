@@ -1,20 +1,26 @@
 from typing import List
 
+import numpy as np
+
 from documentor.structuries.document import Document
 
 from .base import BaseSemanticModel
+from .cache import LRUCache
 
 from wikipedia2vec import Wikipedia2Vec
 
 
 class Wiki2VecTokenization(BaseSemanticModel):
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, cache_size: int | None = 0):
         """
         Initialize the Wiki2VecTokenization class by loading the Wiki2Vec model.
 
         :param model_path: Path to the pre-trained Wiki2Vec model file.
+        :param cache_size: Number of most recently used word lookups to keep, 0 to disable caching
+            (the default), None for no limit. Cached vectors are read-only views of the model's arrays.
         """
         self.model = Wikipedia2Vec.load(model_path)
+        self._vector_cache = LRUCache(cache_size)
 
     def __call__(self, document: Document, *args, **kwargs) -> list[list[float]]:
         """
@@ -35,10 +41,26 @@ class Wiki2VecTokenization(BaseSemanticModel):
           :param word: The word to convert into a vector.
           :return: The vector of the word or None if the word is not found in the model.
           """
+        if word in self._vector_cache:
+            vector = self._vector_cache[word]
+        else:
+            vector = self._lookup_word_vector(word)
+            self._vector_cache[word] = vector
+        return vector.tolist() if vector is not None else None
+
+    def _lookup_word_vector(self, word: str) -> np.ndarray | None:
+        """
+        Look up the vector of a word in the Wiki2Vec model.
+
+        :param word: The word to look up.
+        :return: Read-only view of the word vector or None if the word is not found in the model.
+        """
         try:
             word_entity = self.model.get_word(word)
             if word_entity:
-                return word_entity.vector.tolist()
+                vector = word_entity.vector.view()
+                vector.setflags(write=False)
+                return vector
             else:
                 return None
         except KeyError:
@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 from typing import Iterator
 
 import pandas as pd
-from overrides import overrides
 
 from documentor.structuries.columns import ColumnType
 from documentor.structuries.fragment import Fragment
@@ -80,7 +79,6 @@ class Document(DocumentInterface):
         columns = list[self._columns.keys()]
         self._data = data[columns].copy()
 
-    @overrides
     def build_fragments(self) -> list[Fragment]:
         """
         List of fragments of Document.
@@ -90,9 +88,8 @@ class Document(DocumentInterface):
         :return: list of fragments
         :rtype: list[TextFragment]
         """
-        return [Fragment(**row.to_dict()) for _, row in self._data.iterrows()]
+        return [Fragment(**record) for record in self._data.to_dict('records')]
 
-    @overrides
     def iter_rows(self) -> Iterator[tuple[int, pd.Series]]:
         """
         Iterate over all fragments of the Document with their row numbers.
@@ -103,7 +100,6 @@ class Document(DocumentInterface):
         for i, row in self._data.iterrows():
             yield i, row
 
-    @overrides
     def to_df(self) -> pd.DataFrame:
         """
         Convert Document to pandas DataFrame.
@@ -5,8 +5,6 @@ from dataclasses import dataclass
 from types import UnionType
 from typing import Any
 
-from overrides import overrides
-
 from documentor.structuries.custom_types import LabelType, VectorType
 from documentor.structuries.type_check import TypeChecker as tc
 
@@ -90,15 +88,12 @@ class Fragment(FragmentInterface):
         # tc.check_simple_type(self.token_vectors, list | None)
         pass
 
-    @overrides
     def __str__(self) -> str:
         return self.value
 
-    @overrides
     def to_dict(self) -> dict[str, Any]:
         return {field: getattr(self, field) for field in self.__annotations__.keys()}
 
     @classmethod
-    @overrides
     def param_types_dict(cls) -> dict[str, type | UnionType]:
         return {param: param_type for param, param_type in cls.__annotations__.items()}
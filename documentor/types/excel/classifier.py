@@ -58,7 +58,7 @@ class SheetClassifier(FragmentClassifier):
         else:
             self.model_dict = {}
 
-    def cluster(self, df: pd.DataFrame, type_name: str, df_types: list[str]) -> pd.DataFrame:
+    def cluster(self, df: pd.DataFrame, type_name: str, df_types: list[str], n_jobs: int | None = None) -> pd.DataFrame:
         """
         Choosing the best clustering algorithm and obtaining a dictionary
         with a comparison of user and algorithmic markup.
@@ -69,6 +69,8 @@ class SheetClassifier(FragmentClassifier):
         :type type_name: str
         :param df_types: list of data types included in the dataset
         :type df_types:list[str]
+        :param n_jobs: number of parallel jobs for the parameter grid search, None means sequential
+        :type n_jobs: int | None
         :return: DataFrame with labeled infor,
         the name of the selected algorithm
         :rtype: DataFrame
@@ -78,7 +80,7 @@ class SheetClassifier(FragmentClassifier):
         v_measure = 0
         for grid in [grid_dbscan, grid_optics, grid_kmeans]:
 
-            algo_params = cluster_grid_search_v_measure(grid['algo'], grid['params'], y_to_pred, x)
+            algo_params = cluster_grid_search_v_measure(grid['algo'], grid['params'], y_to_pred, x, n_jobs=n_jobs)
             algo_clustering = grid['algo'](**algo_params)
             algo_clustering.fit(x)
 
@@ -88,9 +90,10 @@ class SheetClassifier(FragmentClassifier):
             algo_y_num_map, algo_dict_map = map_vectors(algo_y_num, y['ground_truth'].tolist())
             algo_y_pred_map = [algo_y_num_map[i] for i in y_to_pred.index]
 
-            if metrics.v_measure_score(algo_y_to_pred, algo_y_pred_map) >= v_measure:
+            score = metrics.v_measure_score(algo_y_to_pred, algo_y_pred_map)
+            if score >= v_measure:
                 x_ = x.copy()
-                v_measure = metrics.v_measure_score(algo_y_to_pred, algo_y_pred_map)
+                v_measure = score
                 x_['ground_truth'] = y
                 x_['old_indexes'] = old_indexes
                 x_['label'] = algo_y_num_map
@@ -126,12 +129,14 @@ class SheetClassifier(FragmentClassifier):
         else:
             return -10
 
-    def classify_fragments(self, doc: SheetDocument) -> [pd.Series, SheetDocument]:
+    def classify_fragments(self, doc: SheetDocument, n_jobs: int | None = None) -> [pd.Series, SheetDocument]:
         """
         Classify fragments of the document.
 
         :param doc: the SheetDocument
         :type doc: SheetDocument
+        :param n_jobs: number of parallel jobs for the parameter grid search, None means sequential
+        :type n_jobs: int | None
         :return: series with types of fragments
         :rtype: pd.Series[LabelType]
         """
@@ -139,9 +144,7 @@ class SheetClassifier(FragmentClassifier):
         # df = row_typing(df)
         # df['num_values'] = df.apply(lambda row: self.create_num_values(row), axis=1)
         df = df.drop(columns=['value', 'start_content', 'row', 'relative_id', 'length'])
-        ret_df = pd.DataFrame()
-        for t, lst in type_dict.items():
-            ret_df = pd.concat([ret_df, self.cluster(df, t, lst)], ignore_index=True)
+        ret_df = pd.concat([self.cluster(df, t, lst, n_jobs=n_jobs) for t, lst in type_dict.items()], ignore_index=True)
 
         ret_df = ret_df.set_index('old_indexes')
         doc.set_label(ret_df['label'])
@@ -153,7 +156,7 @@ class SheetClassifier(FragmentClassifier):
         # df = row_typing(df)
         # df['num_values'] = df.apply(lambda row: self.create_num_values(row), axis=1)
         df = df.drop(columns=['value', 'start_content', 'row', 'relative_id', 'ground_truth', 'length'])
-        ret_df = pd.DataFrame()
+        type_dfs = []
         for t, lst in type_dict.items():
             type_df, old_indexes = selecting(lst, df)
             model_dict = self.model_dict[t].dict_map
@@ -161,9 +164,9 @@ class SheetClassifier(FragmentClassifier):
             model.fit_predict(type_df)
             labels_int = model.labels_
             labels = [model_dict[i] if i in model_dict.keys() else 'trash' for i in labels_int]
-            loc_df = pd.DataFrame(data={'label': labels, 'old_indexes': old_indexes})
-            ret_df = pd.concat([ret_df, loc_df], ignore_index=True)
+            type_dfs.append(pd.DataFrame(data={'label': labels, 'old_indexes': old_indexes}))
 
+        ret_df = pd.concat(type_dfs, ignore_index=True)
         ret_df = ret_df.set_index('old_indexes')
         doc.set_label(ret_df['label'])
         return ret_df['label'].sort_index(), doc
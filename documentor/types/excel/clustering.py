@@ -1,4 +1,4 @@
-from copy import copy
+from collections import Counter, defaultdict
 from itertools import chain
 
 from sklearn.cluster import DBSCAN, OPTICS, KMeans
@@ -8,6 +8,7 @@ from plotly import express as px, graph_objects as go
 from sklearn import metrics
 from sklearn.manifold import TSNE
 from sklearn.model_selection import ParameterGrid
+from sklearn.utils.parallel import Parallel, delayed
 from enum import Enum
 import statistics
 
@@ -125,16 +126,21 @@ def map_vectors(cluster_vector: list[int], labeled_vector: list[str | float]) ->
     """
     res_dict = {}
     cluster_set = set(cluster_vector)
-    labeled_dict = {v: labeled_vector.count(v) for v in set(labeled_vector)}
+    labeled_dict = Counter(labeled_vector)
+    cluster_labels = defaultdict(list)
+    for cluster_value, label in zip(cluster_vector, labeled_vector):
+        if not isinstance(label, float):
+            cluster_labels[cluster_value].append(label)
+    extra_cluster = max(cluster_set, default=-1) + 1
     for cluster_value in cluster_set:
-        sublist = [labeled_vector[i] for i in [i for i, x in enumerate(cluster_vector) if x == cluster_value]]
-        sublist = [x for x in copy(sublist) if not isinstance(x, float)]
+        sublist = cluster_labels[cluster_value]
         if len(sublist) > 0:
-            sub_dict = {sub: sublist.count(sub) for sub in set(sublist)}
-            label_value = max(set(sublist), key=sublist.count)
-            for k, v in sub_dict.items():
-                if sub_dict[k] == labeled_dict[k] and (k != label_value or k != 'trash'):
-                    res_dict[max(cluster_vector) + 1] = k
+            counts = Counter(sublist)
+            sub_set = set(sublist)
+            label_value = max(sub_set, key=counts.__getitem__)
+            for k in sub_set:
+                if counts[k] == labeled_dict[k] and (k != label_value or k != 'trash'):
+                    res_dict[extra_cluster] = k
             res_dict[cluster_value] = label_value
         else:
             res_dict[cluster_value] = 'trash'
@@ -142,7 +148,43 @@ def map_vectors(cluster_vector: list[int], labeled_vector: list[str | float]) ->
     return res_list, res_dict
 
 
-def cluster_grid_search_v_measure(algo: AlgorithmType, grid: dict, y_to_pred: pd.DataFrame, x: pd.DataFrame) -> dict:
+def _fit_labels(algo: AlgorithmType, params: dict, x: pd.DataFrame) -> np.ndarray:
+    """
+    Fit the clustering algorithm with the given parameters.
+
+    :param algo: clusterization algorithm used
+    :type algo: AlgorithmType
+    :param params: parameters of the algorithm
+    :type params: dict
+    :param x: metadata of sheet cells
+    :type x: DataFrame
+    :return: cluster labels of the cells
+    :rtype: np.ndarray
+    """
+    return algo(**params).fit(x).labels_
+
+
+def _silhouette_coefficient(algo: AlgorithmType, params: dict, x: pd.DataFrame) -> float | None:
+    """
+    Fit the clustering algorithm with the given parameters and score the result.
+
+    :param algo: clusterization algorithm used
+    :type algo: AlgorithmType
+    :param params: parameters of the algorithm
+    :type params: dict
+    :param x: metadata of sheet cells
+    :type x: DataFrame
+    :return: silhouette coefficient, or None if all cells fell into one cluster
+    :rtype: float | None
+    """
+    y_num = _fit_labels(algo, params, x)
+    if len(set(y_num)) > 1:
+        return metrics.silhouette_score(x, y_num)
+    return None
+
+
+def cluster_grid_search_v_measure(algo: AlgorithmType, grid: dict, y_to_pred: pd.DataFrame, x: pd.DataFrame,
+                                  n_jobs: int | None = None) -> dict:
     """
     Selection of parameters for the clustering algorithm.
 
@@ -154,19 +196,21 @@ def cluster_grid_search_v_measure(algo: AlgorithmType, grid: dict, y_to_pred: pd
     :type y_to_pred: DataFrame
     :param x: metadata of sheet cells
     :type x: DataFrame
+    :param n_jobs: number of parallel jobs for fitting the parameter grid, None means sequential
+    :type n_jobs: int | None
     :return: best parameters for the algorithm
     :rtype: dict
     """
     best_params = None
     best_metric = -1
 
-    cluster = algo()
-    for params in ParameterGrid(grid):
-        cluster.set_params(**params)
-        cluster.fit(x)
-        y_num = cluster.labels_
-        y_pred = [y_num[i] for i in y_to_pred.index]
-        y_to_t_pred = y_to_pred['ground_truth'].tolist()
+    labeled_indexes = y_to_pred.index.tolist()
+    y_to_t_pred = y_to_pred['ground_truth'].tolist()
+
+    param_list = list(ParameterGrid(grid))
+    labels = Parallel(n_jobs=n_jobs)(delayed(_fit_labels)(algo, params, x) for params in param_list)
+    for params, y_num in zip(param_list, labels):
+        y_pred = [y_num[i] for i in labeled_indexes]
         metric = metrics.v_measure_score(y_to_t_pred, y_pred)
 
         if metric > best_metric:
@@ -176,7 +220,8 @@ def cluster_grid_search_v_measure(algo: AlgorithmType, grid: dict, y_to_pred: pd
     return best_params
 
 
-def cluster_grid_search_silhouette_coefficient(algo: AlgorithmType, grid: dict, x: pd.DataFrame) -> dict:
+def cluster_grid_search_silhouette_coefficient(algo: AlgorithmType, grid: dict, x: pd.DataFrame,
+                                               n_jobs: int | None = None) -> dict:
     """
     Selection of parameters for the clustering algorithm.
 
@@ -186,23 +231,20 @@ def cluster_grid_search_silhouette_coefficient(algo: AlgorithmType, grid: dict,
     :type x: dict
     :param x: metadata of sheet cells
     :type x: DataFrame
+    :param n_jobs: number of parallel jobs for fitting the parameter grid, None means sequential
+    :type n_jobs: int | None
     :return: best parameters for the algorithm
     :rtype: dict
     """
     best_params = None
     best_metric = -1
 
-    cluster = algo()
-    for params in ParameterGrid(grid):
-        cluster.set_params(**params)
-        cluster.fit(x)
-        y_num = cluster.labels_
-        if len(set(y_num)) > 1:
-            metric = metrics.silhouette_score(x, y_num)
-
-            if metric > best_metric:
-                best_params = params
-                best_metric = metric
+    param_list = list(ParameterGrid(grid))
+    scores = Parallel(n_jobs=n_jobs)(delayed(_silhouette_coefficient)(algo, params, x) for params in param_list)
+    for params, metric in zip(param_list, scores):
+        if metric is not None and metric > best_metric:
+            best_params = params
+            best_metric = metric
 
     return best_params
 
@@ -241,7 +283,6 @@ def devide(df: pd.DataFrame, type: list[str]) -> [list[int], pd.DataFrame, pd.Da
     """
     type_df, old_indexes = selecting(type, df)
     type_y = type_df[["ground_truth"]]
-    type_y['ground_truth'].str.strip()
     type_y_to_pred = type_y.loc[(pd.notna(type_y['ground_truth']))]
     type_X = type_df.drop(['ground_truth'], axis=1)
     type_X = type_X.fillna(0)
@@ -249,12 +290,14 @@ def devide(df: pd.DataFrame, type: list[str]) -> [list[int], pd.DataFrame, pd.Da
     return old_indexes, type_X, type_y, type_y_to_pred
 
 
-def row_typing(df: pd.DataFrame) -> pd.DataFrame:
+def row_typing(df: pd.DataFrame, n_jobs: int | None = None) -> pd.DataFrame:
     """
     The function of classifying table rows.
 
     :param df: dataset describing the metadata of all cells in the worksheet
     :type df: DataFrame
+    :param n_jobs: number of parallel jobs for the parameter grid search, None means sequential
+    :type n_jobs: int | None
     :return: dataset describing the metadata of all cells in the worksheet with row types
     :rtype: DataFrame
     """
@@ -267,8 +310,8 @@ def row_typing(df: pd.DataFrame) -> pd.DataFrame:
     ndf.reset_index(drop=True, inplace=True)
 
     arr = np.empty((ndf.tail(1)['row'].iloc[0] + 1, ndf.tail(1)['column'].iloc[0] + 1), dtype="object")
-    for i, row in ndf.iterrows():
-        arr[row['row'], row['column']] = row.values.tolist()
+    for row, column, values in zip(ndf['row'].tolist(), ndf['column'].tolist(), ndf.values.tolist()):
+        arr[row, column] = values
     mass = [list(chain.from_iterable([arr[i][j] for j in range(len(arr[i]))])) for i in range(len(arr))]
     rest_df = pd.DataFrame(data=mass)
     rest_df = rest_df.fillna(0)
@@ -284,15 +327,16 @@ def row_typing(df: pd.DataFrame) -> pd.DataFrame:
 
     s_score = 0
     for grid in [grid_dbscan, grid_optics, grid_kmeans]:
-        algo_params = cluster_grid_search_silhouette_coefficient(grid['algo'], grid['params'], rest_df)
+        algo_params = cluster_grid_search_silhouette_coefficient(grid['algo'], grid['params'], rest_df, n_jobs=n_jobs)
         algo_clustering = grid['algo'](**algo_params)
         algo_clustering.fit(rest_df)
 
         row_types = algo_clustering.labels_
 
-        if metrics.silhouette_score(rest_df, row_types) >= s_score:
+        score = metrics.silhouette_score(rest_df, row_types)
+        if score >= s_score:
             rest_df_ = rest_df.copy()
-            s_score = metrics.silhouette_score(rest_df_, row_types)
+            s_score = score
             rest_df_['labels'] = row_types
             rest_df_['labels'] = rest_df_['labels'].apply(lambda x: x + 1)
             part_list = rest_df_['labels']
@@ -302,12 +346,7 @@ def row_typing(df: pd.DataFrame) -> pd.DataFrame:
     to_merge_df['labels'] = part_list
     to_merge_df = to_merge_df.set_index('row')
 
-    str_type_list = []
-    names = list(df.columns)
-    r_i = names.index('row') + 1
-    for row in df.itertuples():
-        a = to_merge_df['labels'][row[r_i]] if row[r_i] in list(to_merge_df.index) else None
-        str_type_list.append(a)
-    df['row_type'] = str_type_list
+    row_labels = to_merge_df['labels'].to_dict()
+    df['row_type'] = [row_labels.get(row) for row in df['row']]
     df['row_type'] = df['row_type'].fillna(-1)
     return df
\ No newline at end of file
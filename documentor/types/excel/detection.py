@@ -8,6 +8,7 @@ import torch
 from sklearn.decomposition import PCA
 from torch.optim import Adam
 from torch.utils.data import Dataset, DataLoader
+from torchvision.ops import box_iou
 from tqdm import tqdm
 
 from documentor.types.excel.parser import SheetParser
@@ -19,16 +20,23 @@ class CustomDataset(Dataset):
 
     Attributes:
         annotations (list): List of annotations containing feature and target information.
+        cache (bool): Whether processed samples are kept in memory after the first access.
     """
 
-    def __init__(self, annotations: list):
+    def __init__(self, annotations: list, cache: bool = False):
         """
         Initializes the CustomDataset with the provided annotations.
 
         Args:
             annotations (list): List of annotations containing feature and target information.
+            cache (bool): Whether to keep processed samples in memory, so that PCA and target parsing
+                run once per sample instead of once per epoch. The cache grows to hold every sample
+                accessed. With DataLoader(num_workers > 0) each worker process fills its own copy,
+                which is lost at the end of the epoch unless persistent_workers=True is also set.
         """
         self.annotations = annotations
+        self.cache = cache
+        self._samples = {}
 
     def __len__(self) -> int:
         """
@@ -49,6 +57,9 @@ class CustomDataset(Dataset):
         Returns:
             tuple: A tuple containing the features tensor and the target dictionary.
         """
+        if self.cache and idx in self._samples:
+            return self._samples[idx]
+
         # Extract features and convert to tensor
         features = self._apply_pca_to_tensor(
             self._split_and_restructure(torch.tensor(self.annotations[idx]['features'], dtype=torch.float32)))
@@ -58,6 +69,8 @@ class CustomDataset(Dataset):
         labels = torch.ones((len(boxes)), dtype=torch.int64)
         target = {"boxes": torch.tensor(boxes), "labels": labels}
 
+        if self.cache:
+            self._samples[idx] = features, target
         return features, target
 
     def _split_and_restructure(self, data: torch.Tensor) -> torch.Tensor:
@@ -78,11 +91,9 @@ class CustomDataset(Dataset):
         max_col = int(torch.max(data[:, 1]).item())
         output_tensor = torch.zeros((12, max_row, max_col))
 
-        for entry in data:
-            row_idx = int(entry[0].item()) - 1
-            col_idx = int(entry[1].item()) - 1
-            for i in range(12):
-                output_tensor[i, row_idx, col_idx] = entry[i + 2]
+        row_idx = data[:, 0].long() - 1
+        col_idx = data[:, 1].long() - 1
+        output_tensor[:, row_idx, col_idx] = data[:, 2:14].T
 
         return output_tensor
 
@@ -278,10 +289,10 @@ class TableDetectionModel:
                         true_boxes = target['boxes']
                         true_labels = target['labels']
 
+                        iou_matrix = box_iou(true_boxes, pred_boxes)
                         for i in range(len(true_boxes)):
-                            iou_scores = [self.calculate_iou(true_boxes[i], pred_box) for pred_box in pred_boxes]
-                            if iou_scores:
-                                max_iou, max_idx = torch.max(torch.tensor(iou_scores), 0)
+                            if len(pred_boxes):
+                                max_iou, max_idx = torch.max(iou_matrix[i], 0)
                             else:
                                 max_iou, max_idx = 0, 0
                             if max_iou >= self.iou_threshold and pred_labels[max_idx] == true_labels[i]:
@@ -311,21 +322,16 @@ class TableDetectionModel:
 
         def is_row_empty(row):
             for cell in row:
-                value = cell.value
-                left = cell.border.left.style if cell.border.left.style else None
-                right = cell.border.right.style if cell.border.right.style else None
-
-                if any(item is not None for item in [value, left, right]):
+                border = cell.border
+                if cell.value is not None or border.left.style or border.right.style:
                     return False
             return True
 
         def is_column_empty(table, column_index):
             for row in table:
-                value = row[column_index].value
-                top = row[column_index].border.top.style if row[column_index].border.top.style else None
-                bottom = row[column_index].border.bottom.style if row[column_index].border.bottom.style else None
-
-                if any(item is not None for item in [value, top, bottom]):
+                cell = row[column_index]
+                border = cell.border
+                if cell.value is not None or border.top.style or border.bottom.style:
                     return False
             return True
 
@@ -415,9 +421,8 @@ class TableDetectionModel:
         df["color"] = pd.factorize(df["color"])[0]
         df["font_color"] = pd.factorize(df["font_color"])[0]
         df.drop(columns=['value', 'start_content', 'relative_id', 'type'], inplace=True)
-        df_dict = df.to_dict('index')
 
-        features = [tuple(val.values()) for val in df_dict.values()]
+        features = list(df.itertuples(index=False, name=None))
 
         self.model.eval()
         outputs = self.model(features)
@@ -40,11 +40,14 @@ class SheetDocument(Document):
         """
         Iterate over all fragments of the Document.
 
+        Fragments are created one row at a time, so the whole list is never held in memory.
+
         :return: the document fragments
         :rtype: Iterator[Fragment]
         """
-        for fragment in self.build_fragments:
-            yield fragment
+        columns = self._data.columns.tolist()
+        for values in self._data.itertuples(index=False, name=None):
+            yield SheetFragment(**dict(zip(columns, values)))
 
     def iter_all_str(self) -> Iterator[str]:
         """
@@ -53,18 +56,9 @@ class SheetDocument(Document):
         :return: the document fragments
         :rtype: Iterator[str]
         """
-        for fragment in self.build_fragments:
+        for fragment in self.iter_all():
             yield fragment.__str__()
 
-    def to_df(self) -> pd.DataFrame:
-        """
-        Convert Document to pandas DataFrame.
-
-        :return: pandas DataFrame with data about fragments
-        :rtype: pd.DataFrame
-        """
-        return self._data.copy()
-
     @staticmethod
     def row_from_fragment(frag: SheetFragment) -> pd.DataFrame:
         """
@@ -2,7 +2,6 @@ import datetime
 from dataclasses import dataclass
 from types import UnionType
 from typing import Any
-from overrides import overrides
 
 from documentor.structuries.custom_types import LabelType
 from documentor.structuries.fragment import FragmentInterface
@@ -84,11 +83,9 @@ class SheetFragment(FragmentInterface):
         """
         return self.value
 
-    @overrides
     def to_dict(self) -> dict[str, Any]:
         return {field: getattr(self, field) for field in self.__annotations__.keys()}
 
     @classmethod
-    @overrides
     def param_types_dict(cls) -> dict[str, type | UnionType]:
         return {param: param_type for param, param_type in cls.__annotations__.items()}
@@ -1,18 +1,28 @@
+from functools import cache
+from itertools import chain, repeat
+
 import openpyxl
 import pandas as pd
 from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.worksheet.cell_range import CellRange
 
-from documentor.structuries.parser import DocumentParser
+from documentor.structuries.parser import DocumentParser, ExtensionException
 from documentor.structuries.type_check import StaticClassMeta
 
 from documentor.types.excel.document import SheetDocument
 
 
-class ExtensionException(Exception):
+@cache
+def _type_name(value_type: type) -> str:
     """
-    Exception for errors while parsing files.
+    Get the qualified name of a cell value type, e.g. 'str' or 'datetime.datetime'.
+
+    :param value_type: type of the cell value
+    :type value_type: type
+    :return: name of the type
+    :rtype: str
     """
-    pass
+    return str(value_type).split("'")[1]
 
 
 class ParserException(StaticClassMeta):
@@ -35,7 +45,7 @@ class SheetParser(DocumentParser):
                'bottom_border', 'left_border', 'right_border', 'color', 'font_color', 'is_formula']
 
     def parse_file(self, path: str, sheet_name: str, first_cell: str | None = None,
-                   last_cell: str | None = None) -> SheetDocument:
+                   last_cell: str | None = None, detect_formulas: bool = True) -> SheetDocument:
         """
         Create Document from file.
 
@@ -47,6 +57,9 @@ class SheetParser(DocumentParser):
         :type first_cell: str | None
         :param last_cell: the address of the last cell
         :type last_cell: str | None
+        :param detect_formulas: whether to fill is_formula, which requires a second pass over the file;
+            if False, is_formula is False for all cells
+        :type detect_formulas: bool
         :return: SheetDocument object
         :rtype: SheetDocument
         :raises ExtensionException: if file extension is not supported
@@ -55,53 +68,60 @@ class SheetParser(DocumentParser):
         :raises ValueError: if cell address is incorrect
         :raises OSError: if file is not found or can't be opened
         """
+        wb_formulas = None
         try:
             wb = openpyxl.load_workbook(path, data_only=True)
-            wb_formulas = openpyxl.load_workbook(path)
             sheet = wb[sheet_name]
-            sheet_formulas = wb_formulas[sheet_name]
 
-            new_df = pd.DataFrame()
-            merged_cells = sheet.merged_cells
+            start = sheet[first_cell] if first_cell else None
+            end = sheet[last_cell] if last_cell else None
+            bounds = {
+                'min_col': start.column if start is not None else 1,
+                'min_row': start.row if start is not None else 1,
+                'max_col': end.column if end is not None else sheet.max_column,
+                'max_row': end.row if end is not None else sheet.max_row,
+            }
+
+            if detect_formulas:
+                # formulas are only compared with values, so the second pass streams the sheet in read-only mode;
+                # read-only rows end at the last row stored in the file, so the stream is padded with empty rows
+                wb_formulas = openpyxl.load_workbook(path, read_only=True)
+                formula_rows = chain(wb_formulas[sheet_name].iter_rows(**bounds, values_only=True),
+                                     repeat(repeat(None)))
+            else:
+                formula_rows = repeat(repeat(None))
+
+            rows = []
+            merged_cells = self._merged_cells_map(sheet)
             k = 0
-            for column in sheet.iter_rows(
-                    min_col=sheet[first_cell].column if first_cell else None,
-                    min_row=sheet[first_cell].row if first_cell else None,
-                    max_col=sheet[last_cell].column if last_cell else None,
-                    max_row=sheet[last_cell].row if last_cell else None,
-            ):
-                for cel in column:
+            for column, formulas in zip(sheet.iter_rows(**bounds), formula_rows):
+                for cel, formula in zip(column, formulas):
                     k += 1
                     value = cel.value
                     start_value = cel.value
-                    a = str(cel).split('.')
                     is_horizontal = False
                     is_vertical = False
-                    for merged_range in merged_cells:
-                        if cel.coordinate in merged_range:
-                            merged_range_coords = [cell for cell in merged_range.cells]
-                            if len(set(list(cel)[0] for cel in merged_range_coords)) > 1:
-                                is_vertical = True
-                            if len(set(list(cel)[1] for cel in merged_range_coords)) > 1:
-                                is_horizontal = True
-                            first_cell = str(merged_range).split(':')[0]
-                            if value is None:
-                                value = sheet[first_cell].value
-                                start_value = cel.value
-                                k = k - 1
-
-                    if len(a) > 1:
-                        cell_data = [value, start_value, k, str(type(cel.value)).split("'")[1], int(cel.row),
-                                     int(cel.column),
-                                     len(str(cel.value)) if value else 0, is_vertical, is_horizontal, cel.font.bold,
-                                     True if cel.border.top.style else False, True if cel.border.bottom.style else False,
-                                     True if cel.border.left.style else False, True if cel.border.right.style else False,
-                                     cel.fill.start_color.index, cel.font.color.value if cel.font.color else 0,
-                                     True if cel.value != sheet_formulas[cel.coordinate].value else False]
-                        fragment = pd.DataFrame(data=[cell_data], columns=self.COLUMNS)
-                        new_df = pd.concat([new_df, fragment], ignore_index=True)
-
-            return SheetDocument(df=new_df)
+                    merged_range = merged_cells.get((cel.row, cel.column))
+                    if merged_range is not None:
+                        is_vertical = merged_range.min_row != merged_range.max_row
+                        is_horizontal = merged_range.min_col != merged_range.max_col
+                        if value is None:
+                            value = sheet.cell(row=merged_range.min_row, column=merged_range.min_col).value
+                            start_value = cel.value
+                            k = k - 1
+
+                    font = cel.font
+                    border = cel.border
+                    cell_data = [value, start_value, k, _type_name(type(cel.value)), int(cel.row),
+                                 int(cel.column),
+                                 len(str(cel.value)) if value else 0, is_vertical, is_horizontal, font.bold,
+                                 True if border.top.style else False, True if border.bottom.style else False,
+                                 True if border.left.style else False, True if border.right.style else False,
+                                 cel.fill.start_color.index, font.color.value if font.color else 0,
+                                 True if detect_formulas and cel.value != formula else False]
+                    rows.append(cell_data)
+
+            return SheetDocument(df=pd.DataFrame(data=rows, columns=self.COLUMNS))
         except InvalidFileException as ife:
             raise InvalidFileException(ParserException.ExtensionException.format(form=path.split('.')[-1]))
         except KeyError as ke:
@@ -110,8 +130,21 @@ class SheetParser(DocumentParser):
             raise FileNotFoundError(ParserException.FileException.format())
         except ValueError as ve:
             raise ValueError(ParserException.CellContentException.format())
-        except Exception as e:
-            raise Exception(f'{e}')
+        finally:
+            if wb_formulas is not None:
+                wb_formulas.close()
+
+    @staticmethod
+    def _merged_cells_map(sheet) -> dict[tuple[int, int], CellRange]:
+        """
+        Map every cell covered by a merged range to that range.
+
+        :param sheet: the sheet with merged cells
+        :type sheet: openpyxl.worksheet.worksheet.Worksheet
+        :return: merged range for each (row, column) pair of a merged cell
+        :rtype: dict[tuple[int, int], CellRange]
+        """
+        return {coord: merged_range for merged_range in sheet.merged_cells.ranges for coord in merged_range.cells}
 
     def from_csv(self, path: str, sep: str | None) -> SheetDocument:
         """
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from documentor.types.excel.classifier import type_dict
+from documentor.types.excel.clustering import (cluster_grid_search_v_measure, cluster_grid_search_silhouette_coefficient,
+                                               devide, grid_dbscan, map_vectors)
+
+
+def test_grid_search_parallel():
+    df = pd.read_csv('data/hot_list_parsed.csv', index_col='Unnamed: 0')
+    df = df.drop(columns=['value', 'start_content', 'row', 'relative_id', 'length'])
+    old_indexes, x, y, y_to_pred = devide(df, type_dict['str'])
+
+    assert (cluster_grid_search_v_measure(grid_dbscan['algo'], grid_dbscan['params'], y_to_pred, x, n_jobs=2)
+            == cluster_grid_search_v_measure(grid_dbscan['algo'], grid_dbscan['params'], y_to_pred, x))
+    assert (cluster_grid_search_silhouette_coefficient(grid_dbscan['algo'], grid_dbscan['params'], x, n_jobs=2)
+            == cluster_grid_search_silhouette_coefficient(grid_dbscan['algo'], grid_dbscan['params'], x))
+
+
+def test_map_vectors():
+    cluster_vector = [0, 0, 0, 1, 1, 1, 2]
+    labeled_vector = ['a', 'a', 'b', 'c', 'c', 'b', float('nan')]
+
+    res_list, res_dict = map_vectors(cluster_vector, labeled_vector)
+
+    assert res_list == ['a', 'a', 'a', 'c', 'c', 'c', 'trash']
+    assert res_dict == {0: 'a', 1: 'c', 2: 'trash', 3: 'c'}
+
+
+def test_map_vectors_empty():
+    assert map_vectors([], []) == ([], {})
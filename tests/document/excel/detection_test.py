@@ -0,0 +1,46 @@
+import torch
+
+from documentor.types.excel.detection import CustomDataset
+
+
+def make_annotations() -> list:
+    features = [[row, column] + [float(row * column + i) for i in range(12)]
+                for row in range(1, 6) for column in range(1, 5)]
+    return [{'features': features, 'target': "['A1:B3']"}]
+
+
+def count_pca_calls(monkeypatch, dataset: CustomDataset) -> list:
+    calls = []
+    apply_pca = dataset._apply_pca_to_tensor
+
+    def counting_apply_pca(tensor):
+        calls.append(tensor)
+        return apply_pca(tensor)
+
+    monkeypatch.setattr(dataset, '_apply_pca_to_tensor', counting_apply_pca)
+    return calls
+
+
+def test_dataset_cache(monkeypatch):
+    dataset = CustomDataset(make_annotations(), cache=True)
+    calls = count_pca_calls(monkeypatch, dataset)
+
+    features, target = dataset[0]
+    cached_features, cached_target = dataset[0]
+
+    assert len(calls) == 1
+    assert torch.equal(features, cached_features)
+    assert torch.equal(target['boxes'], cached_target['boxes'])
+    assert torch.equal(target['labels'], cached_target['labels'])
+
+
+def test_dataset_without_cache(monkeypatch):
+    dataset = CustomDataset(make_annotations())
+    calls = count_pca_calls(monkeypatch, dataset)
+
+    features, target = dataset[0]
+    second_features, second_target = dataset[0]
+
+    assert len(calls) == 2
+    assert torch.equal(features, second_features)
+    assert torch.equal(target['boxes'], second_target['boxes'])
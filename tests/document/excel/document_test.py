@@ -64,3 +64,12 @@ def test_iter_rows(simple_document):
     assert rows[0][1].value == 'Value'
     assert rows[1][0] == 1
     assert rows[1][1].value == 'Envera'
+
+
+def test_iter_all(simple_document):
+    document, data = init_document(simple_document)
+
+    fragments = list(document.iter_all())
+
+    assert fragments == document.build_fragments
+    assert list(document.iter_all_str()) == ['Value', 'Envera']
@@ -20,6 +20,17 @@ PARSER_WORK_PARAMETRIZER = [
      'last_cell': 'U75'},
 ]
 
+PARSER_PAST_DATA_PARAMETRIZER = [
+    {'path': 'data/Global_Hot_List.xlsx',
+     'sheet_name': 'Hotlist - Identified ',
+     'first_cell': 'A5',
+     'last_cell': 'Z200'},
+    {'path': 'data/Global_Hot_List.xlsx',
+     'sheet_name': 'Hotlist',
+     'first_cell': 'B3',
+     'last_cell': 'AC300'},
+]
+
 PARSER_EXCEPTIONS_PARAMETRIZER = [
     (
         {'path': 'data/Global_Hot_List.xls',
@@ -1,9 +1,11 @@
 from documentor.types.excel.parser import SheetParser
 from documentor.types.excel.document import SheetDocument
 
-from tests.document.excel.parameters import PARSER_WORK_PARAMETRIZER, PARSER_EXCEPTIONS_PARAMETRIZER
+from tests.document.excel.parameters import (PARSER_WORK_PARAMETRIZER, PARSER_EXCEPTIONS_PARAMETRIZER,
+                                             PARSER_PAST_DATA_PARAMETRIZER)
 
 import pytest
+from openpyxl.utils.cell import coordinate_to_tuple
 
 
 @pytest.mark.parametrize('test_values', PARSER_WORK_PARAMETRIZER)
@@ -19,3 +21,34 @@ def test_sheet_parse_exceptions(test_values, expected_attrs):
     with pytest.raises(Exception) as excinfo:
         doc = parser.parse_file(**test_values)
     assert expected_attrs in str(excinfo)
+
+
+def test_sheet_parse_merged_cells():
+    parser = SheetParser()
+    df = parser.parse_file(**PARSER_WORK_PARAMETRIZER[1]).to_df()
+    merged = df[(df['column'] == 1) & (df['row'].between(14, 24))]
+
+    assert merged['vertically_merged'].all()
+    assert not merged['horizontally_merged'].any()
+    assert (merged['value'] == merged['value'].iloc[0]).all()
+    assert merged['start_content'].iloc[1:].isna().all()
+
+
+def test_sheet_parse_without_formulas():
+    parser = SheetParser()
+    with_formulas = parser.parse_file(**PARSER_WORK_PARAMETRIZER[0]).to_df()
+    without_formulas = parser.parse_file(**PARSER_WORK_PARAMETRIZER[0], detect_formulas=False).to_df()
+
+    assert with_formulas['is_formula'].any()
+    assert not without_formulas['is_formula'].any()
+    assert with_formulas.drop(columns='is_formula').equals(without_formulas.drop(columns='is_formula'))
+
+
+@pytest.mark.parametrize('test_values', PARSER_PAST_DATA_PARAMETRIZER)
+def test_sheet_parse_past_data(test_values):
+    parser = SheetParser()
+    with_formulas = parser.parse_file(**test_values).to_df()
+    without_formulas = parser.parse_file(**test_values, detect_formulas=False).to_df()
+
+    assert with_formulas['row'].max() == coordinate_to_tuple(test_values['last_cell'])[0]
+    assert with_formulas.drop(columns='is_formula').equals(without_formulas.drop(columns='is_formula'))
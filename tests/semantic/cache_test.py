@@ -0,0 +1,66 @@
+import pytest
+
+from documentor.semantic.preprocessing.cache import LRUCache
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(0)
+    cache['a'] = 1
+
+    assert 'a' not in cache
+    assert len(cache) == 0
+
+
+def test_lru_cache_single_entry():
+    cache = LRUCache(1)
+    cache['a'] = 1
+    assert cache['a'] == 1
+
+    cache['b'] = 2
+    assert 'a' not in cache
+    assert cache['b'] == 2
+    assert len(cache) == 1
+
+
+def test_lru_cache_unbounded():
+    cache = LRUCache(None)
+    for i in range(1000):
+        cache[i] = i
+
+    assert len(cache) == 1000
+    assert all(cache[i] == i for i in range(1000))
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache['a'] == 1
+
+    cache['c'] = 3
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+
+
+def test_lru_cache_overwrite_refreshes_order():
+    cache = LRUCache(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache['a'] = 10
+
+    cache['c'] = 3
+    assert cache['a'] == 10
+    assert 'b' not in cache
+
+
+def test_lru_cache_miss():
+    cache = LRUCache(2)
+    assert 'a' not in cache
+    with pytest.raises(KeyError):
+        cache['a']
+
+
+def test_lru_cache_negative_size():
+    with pytest.raises(ValueError):
+        LRUCache(-1)